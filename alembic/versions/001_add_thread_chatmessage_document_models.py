@@ -14,6 +14,10 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+# Declared once so there is a single source of truth for the enum's values;
+# SQLAlchemy creates the type the first time the column is emitted.
+messagerole = sa.Enum('USER', 'ASSISTANT', 'SYSTEM', name='messagerole')
+
 
 def upgrade() -> None:
     op.create_table('users',
@@ -38,7 +42,10 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    
+    # PostgreSQL does not index FK columns automatically; without this every
+    # lookup/cascade on conversations by user is a sequential scan.
+    op.create_index(op.f('ix_conversations_user_id'), 'conversations', ['user_id'])
+
     op.create_table('documents',
     sa.Column('title', sa.String(length=255), nullable=False),
     sa.Column('content', sa.Text(), nullable=False),
@@ -52,10 +59,11 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    
+    op.create_index(op.f('ix_documents_user_id'), 'documents', ['user_id'])
+
     op.create_table('messages',
     sa.Column('content', sa.Text(), nullable=False),
-    sa.Column('role', sa.Enum('USER', 'ASSISTANT', 'SYSTEM', name='messagerole'), nullable=False),
+    sa.Column('role', messagerole, nullable=False),
     sa.Column('conversation_id', sa.Integer(), nullable=False),
     sa.Column('extra_data', sa.JSON(), nullable=True),
     sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
@@ -64,7 +72,10 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    
+    # Composite index covers both the FK probe and time-ordered pagination
+    # of a conversation's messages.
+    op.create_index('ix_messages_conversation_created', 'messages', ['conversation_id', 'created_at'])
+
     op.create_table('conversation_documents',
     sa.Column('conversation_id', sa.Integer(), nullable=False),
     sa.Column('document_id', sa.Integer(), nullable=False),
@@ -75,12 +86,19 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('id')
     )
+    op.create_index(op.f('ix_conversation_documents_conversation_id'), 'conversation_documents', ['conversation_id'])
+    op.create_index(op.f('ix_conversation_documents_document_id'), 'conversation_documents', ['document_id'])
 
 
 def downgrade() -> None:
+    op.drop_index(op.f('ix_conversation_documents_document_id'), table_name='conversation_documents')
+    op.drop_index(op.f('ix_conversation_documents_conversation_id'), table_name='conversation_documents')
     op.drop_table('conversation_documents')
+    op.drop_index('ix_messages_conversation_created', table_name='messages')
     op.drop_table('messages')
+    op.drop_index(op.f('ix_documents_user_id'), table_name='documents')
     op.drop_table('documents')
+    op.drop_index(op.f('ix_conversations_user_id'), table_name='conversations')
     op.drop_table('conversations')
     op.drop_index(op.f('ix_users_username'), table_name='users')
     op.drop_index(op.f('ix_users_email'), table_name='users')
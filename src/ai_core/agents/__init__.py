@@ -1,6 +1,6 @@
 """Multi-agent system components."""
 
-from .base.base import BaseAgent
+from .base import BaseAgent
 from .agent_factory import AgentFactory, AgentType
 from .agent_router import AgentRouter
 from .chat_agent.agent import ChatAgent
@@ -2,7 +2,7 @@
 
 from typing import Dict, Type, Optional, Any
 from enum import Enum
-from .base.base import BaseAgent
+from .base import BaseAgent
 from .chat_agent.agent import ChatAgent
 from .neo4j_agent.agent import Neo4jAgent
 from .rag_agent.agent import RAGAgent
@@ -24,6 +24,11 @@ class AgentFactory:
     
     # Registry mapping agent types to classes
     _agents: Dict[AgentType, Type[BaseAgent]] = {}
+
+    # Shared default-config instances, one per type. Agent construction opens
+    # LLM clients and connection pools, so the common config=None path reuses
+    # a singleton instead of rebuilding those per request.
+    _singletons: Dict[AgentType, BaseAgent] = {}
     
     @classmethod
     def register(cls, agent_type: AgentType, agent_class: Type[BaseAgent]) -> None:
@@ -49,25 +54,33 @@ class AgentFactory:
     ) -> BaseAgent:
         """
         Create agent instance.
-        
+
         Args:
             agent_type: Type of agent to create
             config: Optional configuration dict
-            
+
         Returns:
-            Initialized agent instance
-            
+            Initialized agent instance. Calls without a config share one
+            instance per agent type; a custom config always gets a fresh one.
+
         Raises:
             ValueError: If agent type not registered
         """
-        if agent_type not in cls._agents:
+        agent_class = cls._agents.get(agent_type)
+        if agent_class is None:
             available = ", ".join([t.value for t in cls._agents.keys()])
             raise ValueError(
                 f"Unknown agent type: {agent_type}. "
                 f"Available agents: {available}"
             )
-        
-        agent_class = cls._agents[agent_type]
+
+        if config is None:
+            instance = cls._singletons.get(agent_type)
+            if instance is None:
+                instance = agent_class(None)
+                cls._singletons[agent_type] = instance
+            return instance
+
         return agent_class(config)
     
     @classmethod
@@ -1,16 +1,74 @@
 """Intent detection and automatic agent routing."""
 
 from typing import Dict, Any, Optional
+from collections import OrderedDict
+import asyncio
 import logging
-from langchain_core.messages import HumanMessage
+import re
+from langchain_core.messages import HumanMessage, SystemMessage
 
 from ..llm import LLMFactory, LLMProviderType
 from ...config.settings import settings
 from .agent_factory import AgentFactory, AgentType
-from ..prompts import get_intent_detection_prompt
+from ..prompts import get_intent_detection_prompt, INTENT_DETECTION_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Keyword fast path: obvious inputs are classified locally in microseconds
+# instead of paying an LLM round-trip. Only ambiguous input (no match, or
+# matches for several agents) falls through to the LLM classifier.
+_KEYWORD_PATTERNS: Dict[AgentType, re.Pattern] = {
+    AgentType.NEO4J: re.compile(
+        r'\b(cypher|neo4j|graph|node|nodes|relationship|relationships|'
+        r'shortest path|traverse|connected)\b',
+        re.IGNORECASE,
+    ),
+    AgentType.RAG: re.compile(
+        r'\b(document|documents|documentation|knowledge base|'
+        r'search for|find information|according to)\b',
+        re.IGNORECASE,
+    ),
+    AgentType.CHAT: re.compile(
+        r'^\s*(hello|hi|hey|how are you|thanks|thank you|'
+        r'tell me a joke|good (morning|afternoon|evening))\b',
+        re.IGNORECASE,
+    ),
+}
+
+# Max entries kept in the process-wide LLM classification cache; each entry
+# is a short normalized string plus a (AgentType, float) tuple.
+_INTENT_CACHE_SIZE = 4096
+
+# Precomputed lookup structures for parsing the classifier's reply: a value
+# table instead of exception-driven AgentType(...) coercion, and a single
+# alternation pattern instead of a per-member substring scan.
+_AGENT_BY_VALUE: Dict[str, AgentType] = {t.value: t for t in AgentType}
+_AGENT_ALTERNATION = re.compile('|'.join(re.escape(t.value) for t in AgentType))
+# Confidence scores look like '0.95'/'1'; a pre-check keeps the parse off the
+# (expensive) exception path when the model emits something else.
+_CONFIDENCE_RE = re.compile(r'\d*\.?\d+$')
+
+# Shared routing LLM. Routers are often built per request (FastAPI Depends),
+# and LLM client construction (HTTP session, tokenizer) is too expensive to
+# repeat, so all router instances reuse one lazily-created client.
+_ROUTER_LLM = None
+
+
+def _get_router_llm():
+    """Create the routing LLM once and reuse it across AgentRouter instances."""
+    global _ROUTER_LLM
+    if _ROUTER_LLM is None:
+        _ROUTER_LLM = LLMFactory.create(
+            provider_type=LLMProviderType(settings.LLM_PROVIDER),
+            model="gpt-3.5-turbo",  # Fast model for routing
+            temperature=0.0,  # Deterministic
+            max_tokens=50,
+            api_key=settings.OPENAI_API_KEY,
+            base_url=settings.OPENAI_API_BASE,
+            enable_guardrail=False  # No guardrail for routing
+        )
+    return _ROUTER_LLM
+
 
 class AgentRouter:
     """
@@ -21,19 +79,17 @@ class AgentRouter:
     - Confidence-based fallback
     - Manual agent selection support
     """
-    
+
+    # LRU of normalized input -> (agent_type, confidence), so retries and
+    # repeated phrasings don't pay the LLM round-trip again. Class-level,
+    # like the shared routing LLM: routers are built per request, and a
+    # per-instance cache would be discarded before it could ever hit.
+    _intent_cache: "OrderedDict[str, tuple[AgentType, float]]" = OrderedDict()
+
     def __init__(self):
-        """Initialize router with fast LLM for intent detection."""
-        self.llm = LLMFactory.create(
-            provider_type=LLMProviderType(settings.LLM_PROVIDER),
-            model="gpt-3.5-turbo",  # Fast model for routing
-            temperature=0.0,  # Deterministic
-            max_tokens=50,
-            api_key=settings.OPENAI_API_KEY,
-            base_url=settings.OPENAI_API_BASE,
-            enable_guardrail=False  # No guardrail for routing
-        )
-    
+        """Initialize router with the shared fast LLM for intent detection."""
+        self.llm = _get_router_llm()
+
     async def detect_intent(self, user_input: str) -> tuple[AgentType, float]:
         """
         Detect which agent to use with confidence score.
@@ -44,33 +100,73 @@ class AgentRouter:
         Returns:
             Tuple of (agent_type, confidence_score)
         """
+        matches = [
+            agent_type for agent_type, pattern in _KEYWORD_PATTERNS.items()
+            if pattern.search(user_input)
+        ]
+        if len(matches) == 1:
+            return matches[0], 0.9
+
+        norm = " ".join(user_input.lower().split())[:256]
+        cached = self._intent_cache.get(norm)
+        if cached is not None:
+            self._intent_cache.move_to_end(norm)
+            return cached
+
         prompt = get_intent_detection_prompt(user_input)
 
         try:
-            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
-            intent_str = response.content.strip().lower()
-            
+            # The reply is just '<agent> <confidence>', so stream and stop as
+            # soon as both tokens are complete instead of waiting for the
+            # model to finish; breaking out cancels the upstream request.
+            buf = ""
+            async for chunk in self.llm.astream([
+                SystemMessage(content=INTENT_DETECTION_SYSTEM_PROMPT),
+                HumanMessage(content=prompt),
+            ]):
+                buf += chunk.content or ""
+                parts = buf.split()
+                if len(parts) >= 3 or (len(parts) == 2 and buf[-1:].isspace()):
+                    break
+            intent_str = buf.strip().lower()
+
             parts = intent_str.split()
             if len(parts) >= 2:
-                agent_str, confidence_str = parts[0], parts[1]
-                try:
-                    agent_type = AgentType(agent_str)
-                    confidence = float(confidence_str)
-                    return agent_type, confidence
-                except (ValueError, KeyError):
-                    pass
-            
-            for agent_type in AgentType:
-                if agent_type.value in intent_str:
-                    return agent_type, 0.5
-            
-            logger.warning(f"Could not parse intent from: {intent_str}")
+                agent_type = _AGENT_BY_VALUE.get(parts[0])
+                if agent_type is not None and _CONFIDENCE_RE.match(parts[1]):
+                    return self._remember(norm, agent_type, float(parts[1]))
+
+            match = _AGENT_ALTERNATION.search(intent_str)
+            if match:
+                return self._remember(norm, _AGENT_BY_VALUE[match.group()], 0.5)
+
+            logger.warning("Could not parse intent from: %s", intent_str)
             return AgentType.CHAT, 0.3
-            
+
         except Exception as e:
-            logger.error(f"Intent detection failed: {e}")
+            logger.error("Intent detection failed: %s", e)
             return AgentType.CHAT, 0.0
+
+    def _remember(
+        self, norm: str, agent_type: AgentType, confidence: float
+    ) -> tuple[AgentType, float]:
+        """Cache a successful LLM classification, evicting the oldest entry."""
+        self._intent_cache[norm] = (agent_type, confidence)
+        if len(self._intent_cache) > _INTENT_CACHE_SIZE:
+            self._intent_cache.popitem(last=False)
+        return agent_type, confidence
     
+    async def _prewarm(self, agent_type: AgentType) -> None:
+        """Speculatively construct an agent so its clients/pools are ready.
+
+        Construction only — nothing is executed. Failures are logged and
+        swallowed; the real creation path will surface them if they matter.
+        """
+        try:
+            AgentFactory.create(agent_type, None)
+        except Exception as e:
+            logger.warning("Speculative prewarm of %s failed: %s", agent_type, e)
+
     async def route(
         self, 
         user_input: str,
@@ -98,18 +194,28 @@ class AgentRouter:
         confidence = 1.0
         
         if agent_type is None:
-            detected_type, confidence = await self.detect_intent(user_input)
-            
+            if settings.ROUTER_SPECULATIVE:
+                # Overlap the classifier's LLM round-trip with warm-up of the
+                # most-likely agent; the warmed instance is simply unused if
+                # detection picks a different one.
+                detected, _ = await asyncio.gather(
+                    self.detect_intent(user_input),
+                    self._prewarm(AgentType.CHAT),
+                )
+                detected_type, confidence = detected
+            else:
+                detected_type, confidence = await self.detect_intent(user_input)
+
             if confidence < confidence_threshold:
                 logger.warning(
-                    f"Low confidence ({confidence:.2f}) for {detected_type}, "
-                    f"defaulting to CHAT agent"
+                    "Low confidence (%.2f) for %s, defaulting to CHAT agent",
+                    confidence, detected_type,
                 )
                 agent_type = AgentType.CHAT
             else:
                 agent_type = detected_type
                 auto_routed = True
-                logger.info(f"Auto-routed to {agent_type} (confidence: {confidence:.2f})")
+                logger.info("Auto-routed to %s (confidence: %.2f)", agent_type, confidence)
         
         agent = AgentFactory.create(agent_type, config)
         
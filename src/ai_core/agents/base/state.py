@@ -28,7 +28,16 @@ class BaseAgentState(TypedDict):
     
     # Session tracking for checkpointer
     session_id: Optional[str]
-    
+
+    # Final response text, written by the terminal node. Lets callers read
+    # the answer directly instead of walking messages for the last AI turn.
+    last_response: Optional[str]
+
+    # True while the graph is serving execute_stream. Nodes that have a
+    # non-streaming fast path (e.g. the chat batcher) must skip it here so
+    # tokens still surface through the model callbacks.
+    stream: Optional[bool]
+
     # Metadata and error tracking
     metadata: Optional[Dict[str, Any]]
     error: Optional[str]
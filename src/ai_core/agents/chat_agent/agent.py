@@ -1,5 +1,9 @@
 """Chat agent for fast general conversation."""
 
+import asyncio
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
@@ -9,6 +13,114 @@ from ...llm.llm_factory import LLMFactory, LLMProviderType
 from .state import ChatAgentState
 from ....config.settings import settings
 
+# Role-string → message-class dispatch for converting history dicts; a dict
+# probe per message beats the branchy if/elif chain on long histories.
+_ROLE_TO_LC = {
+    "user": HumanMessage,
+    "assistant": AIMessage,
+}
+
+# Sessions whose converted histories are kept for incremental reuse.
+_HISTORY_CACHE_SIZE = 256
+
+__all__ = ["ChatAgent"]
+
+
+class _ChatBatcher:
+    """Coalesces concurrent chat LLM calls into one provider batch request.
+
+    OpenAI-compatible backends serve several prompts in a single HTTP call
+    far more efficiently than one call per request. Callers submit their
+    message list and await a future; a short-lived drain task collects up
+    to ``max_batch`` submissions arriving within ``window_ms`` and sends
+    them via the client's abatch. A submission that stays alone in the
+    window falls back to the provider's normal ainvoke path, so idle
+    traffic pays nothing beyond the window wait.
+    """
+
+    def __init__(self, llm, max_batch: int, window_ms: int):
+        self._llm = llm
+        self._max_batch = max_batch
+        self._window_s = window_ms / 1000.0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, messages: list):
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((messages, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        while not self._queue.empty():
+            items = [self._queue.get_nowait()]
+            # Hold the window open for stragglers up to the batch cap.
+            while len(items) < self._max_batch:
+                try:
+                    items.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=self._window_s)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            if len(items) == 1:
+                messages, future = items[0]
+                try:
+                    result = await self._llm.ainvoke(messages)
+                    if not future.done():
+                        future.set_result(result)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            try:
+                responses = await self._llm.client.abatch([m for m, _ in items])
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), response in zip(items, responses):
+                if not future.done():
+                    future.set_result(response)
+
+
+# Process-wide batchers keyed by LLM provider identity. Providers come from
+# LLMFactory.create_cached and live for the process, so the id is stable.
+# Agents are rebuilt per request; a per-instance batcher would never see two
+# concurrent submissions to coalesce.
+_batchers: Dict[int, _ChatBatcher] = {}
+
+
+def _get_batcher(llm) -> _ChatBatcher:
+    """Return the shared batcher for this provider, creating it once."""
+    batcher = _batchers.get(id(llm))
+    if batcher is None:
+        batcher = _ChatBatcher(
+            llm,
+            max_batch=settings.CHAT_BATCH_MAX,
+            window_ms=settings.CHAT_BATCH_WINDOW_MS,
+        )
+        _batchers[id(llm)] = batcher
+    return batcher
+
+
+@lru_cache(maxsize=128)
+def _sys_msg(prompt: str) -> SystemMessage:
+    """Share one SystemMessage per distinct prompt.
+
+    System prompts are static across a session, so every request was
+    allocating an identical object just to lead the message list. The
+    stable content-derived id makes the message idempotent under the
+    add_messages reducer: re-sending it on a checkpointed thread replaces
+    the stored copy instead of appending a duplicate every turn.
+    """
+    digest = hashlib.blake2b(prompt.encode(), digest_size=8).hexdigest()
+    return SystemMessage(content=prompt, id=f"system-{digest}")
+
 
 class ChatAgent(BaseAgent):
     """
@@ -24,7 +136,17 @@ class ChatAgent(BaseAgent):
     - Simple Q&A
     - Quick responses
     """
-    
+
+    # Per-session converted histories: session_id → (dict count, last
+    # content seen, converted messages). Each turn only the new tail of
+    # the history is converted to message objects; the shared prefix is
+    # reused as-is, since callers treat built messages as read-only.
+    # Class-level, like the Neo4j agent's caches: agents on the
+    # history-replay path are rebuilt per request, so a per-instance
+    # cache would always start empty.
+    _history_cache: OrderedDict = OrderedDict()
+
+
     def __init__(
         self,
         config: Optional[Dict[str, Any]] = None
@@ -37,8 +159,9 @@ class ChatAgent(BaseAgent):
         """
         config = config or {}
         
-        # Create LLM with OpenRouter support
-        self.llm = LLMFactory.create(
+        # Create LLM with OpenRouter support; shared per configuration so
+        # re-instantiated agents reuse the warm HTTP client.
+        self.llm = LLMFactory.create_cached(
             provider_type=LLMProviderType(config.get("llm_provider", settings.LLM_PROVIDER)),
             model=config.get("model", settings.LLM_MODEL),
             temperature=config.get("temperature", settings.LLM_TEMPERATURE),
@@ -48,6 +171,8 @@ class ChatAgent(BaseAgent):
             enable_guardrail=config.get("enable_guardrail", False),  # Disable by default for chat
         )
         
+        self._batcher = _get_batcher(self.llm) if settings.CHAT_BATCH_ENABLED else None
+
         super().__init__(agent_type="chat", config=config)
     
     async def execute(
@@ -75,18 +200,56 @@ class ChatAgent(BaseAgent):
         """
         # Build messages from history + current query
         messages = []
-        
+
         # Add system prompt if provided
         if system_prompt:
-            messages.append(SystemMessage(content=system_prompt))
-        
-        # Convert history to messages
-        if history:
-            for msg in history:
-                if msg.get("role") == "user":
-                    messages.append(HumanMessage(content=msg["content"]))
-                elif msg.get("role") == "assistant":
-                    messages.append(AIMessage(content=msg["content"]))
+            messages.append(_sys_msg(system_prompt))
+
+        # With a checkpointer, the thread already holds every prior turn:
+        # send only the new user message and let the add_messages reducer
+        # merge server-side. Replaying the caller's history here would
+        # duplicate each prior turn in the persisted thread.
+        use_checkpoint_history = (
+            session_id is not None
+            and settings.ENABLE_CHECKPOINTER
+            and settings.CHAT_CHECKPOINT_HISTORY
+        )
+
+        # Convert history to messages, reusing the session's previously
+        # converted prefix so each turn only converts the new entries.
+        if history and not use_checkpoint_history:
+            converted = None
+            if session_id:
+                cached = self._history_cache.get(session_id)
+                if cached is not None:
+                    count, last_content, prefix = cached
+                    # Prefix check: the caller may truncate or rewrite the
+                    # history, in which case fall back to a full conversion.
+                    if count <= len(history) and (
+                        count == 0 or history[count - 1].get("content") == last_content
+                    ):
+                        converted = prefix + [
+                            _ROLE_TO_LC[msg["role"]](content=msg["content"])
+                            for msg in history[count:]
+                            if msg.get("role") in _ROLE_TO_LC
+                        ]
+
+            if converted is None:
+                converted = [
+                    _ROLE_TO_LC[msg["role"]](content=msg["content"])
+                    for msg in history
+                    if msg.get("role") in _ROLE_TO_LC
+                ]
+
+            if session_id:
+                self._history_cache[session_id] = (
+                    len(history), history[-1].get("content"), converted
+                )
+                self._history_cache.move_to_end(session_id)
+                if len(self._history_cache) > _HISTORY_CACHE_SIZE:
+                    self._history_cache.popitem(last=False)
+
+            messages.extend(converted)
         
         # Add current query
         messages.append(HumanMessage(content=query))
@@ -96,6 +259,7 @@ class ChatAgent(BaseAgent):
             "messages": messages,
             "session_id": session_id,
             "system_prompt": system_prompt,
+            "stream": False,
             "metadata": metadata or {},
         }
         
@@ -112,20 +276,20 @@ class ChatAgent(BaseAgent):
     def _build_graph(self) -> StateGraph:
         """
         Build simple chat graph.
-        
+
         Graph: chat_node → END
-        
+
         Returns:
-            Compiled StateGraph
+            Uncompiled StateGraph; BaseAgent compiles it with the checkpointer
         """
         workflow = StateGraph(ChatAgentState)
-        
+
         workflow.add_node("chat", self._chat_node)
-        
+
         workflow.set_entry_point("chat")
         workflow.add_edge("chat", END)
-        
-        return workflow.compile()
+
+        return workflow
     
     async def _chat_node(self, state: ChatAgentState) -> Dict[str, Any]:
         """
@@ -143,15 +307,34 @@ class ChatAgent(BaseAgent):
             # Messages already in state with add_messages reducer
             # No need to rebuild - just use directly
             messages = state.get("messages", [])
-            
+
             if not messages:
                 raise ValueError("No messages in state")
+
+            # On the checkpoint-history path the persisted thread supplies
+            # prior turns and nothing upstream trims it, so bound the
+            # prompt here. Trimming only what goes to the LLM leaves the
+            # stored thread intact; the byte-stable cut keeps the
+            # provider's prompt cache warm across turns.
+            messages = self.truncate_lc_history(messages)
             
-            response = await self.llm.ainvoke(messages)
+            # Batched calls resolve through abatch/ainvoke and emit no
+            # stream events, so a streaming run must bypass the batcher or
+            # execute_stream consumers would see nothing.
+            if self._batcher is not None and not state.get("stream"):
+                response = await self._batcher.submit(messages)
+            else:
+                # Stream and accumulate instead of awaiting the full
+                # completion: chunks surface through the model callbacks,
+                # so execute_stream consumers see the first token as soon
+                # as it arrives rather than after the last one. The
+                # provider wrapper keeps guardrails/retry/fallback intact.
+                response = await self.llm.astream_accumulate(messages)
             
             # Return AI message - add_messages will auto-merge it
             return {
                 "messages": [response],
+                "last_response": response.content if hasattr(response, "content") else str(response),
                 "error": None
             }
             
@@ -164,5 +347,6 @@ class ChatAgent(BaseAgent):
             )
             return {
                 "messages": [error_msg],
+                "last_response": error_msg.content,
                 "error": str(e)
             }
@@ -11,9 +11,13 @@ class Neo4jAgentState(BaseAgentState, total=False):
     plan: Optional[Dict[str, Any]]
     schema: Optional[Dict[str, Any]]
     cypher_query: Optional[str]
+    cypher_params: Optional[Dict[str, Any]]
     validation: Optional[Dict[str, Any]]
     explain: Optional[Dict[str, Any]]
+    cache_hit: Optional[bool]
+    cache_key: Optional[str]
     results: Optional[List[Dict[str, Any]]]
+    results_truncated: Optional[bool]
     attempts: Optional[int]
     success: Optional[bool]
     skip_retry: Optional[bool]
@@ -1,11 +1,13 @@
 """RAG agent for retrieval-augmented generation."""
 
+import asyncio
 from typing import Dict, Any, Optional, List
 from langgraph.graph import StateGraph, END
 
 from ..base import BaseAgent
-from ...llm.llm_factory import LLMFactory
+from ...llm.llm_factory import LLMFactory, LLMProviderType
 from .state import RAGAgentState
+from ....config.settings import settings
 from ...tools.think import ThinkTool
 from ...tools.plan import PlanTool
 from ...vectorstore.pgvector_store import PgVectorStore
@@ -55,7 +57,14 @@ class RAGAgent(BaseAgent):
             top_k: Number of documents to retrieve
             **kwargs: Additional configuration
         """
-        self.llm = LLMFactory.create(provider=llm_provider, model=model)
+        # Shared per configuration so per-request agent construction
+        # reuses the warm HTTP client instead of re-handshaking.
+        self.llm = LLMFactory.create_cached(
+            provider_type=LLMProviderType(llm_provider or settings.LLM_PROVIDER),
+            model=model or settings.LLM_MODEL,
+            api_key=settings.OPENAI_API_KEY,
+            base_url=settings.OPENAI_API_BASE,
+        )
         self.vectorstore = PgVectorStore(config=vectorstore_config)
         self.embeddings = get_embedding_function()
         self.think_tool = ThinkTool()
@@ -68,29 +77,44 @@ class RAGAgent(BaseAgent):
         Build RAG agent graph.
         
         Graph:
-        think → plan → retrieve → rerank → generate → respond → END
-        
+        prepare (think → plan ∥ retrieve) → rerank → generate → respond → END
+
+        Retrieval depends only on the query, not on thinking or planning,
+        so the prepare node overlaps the two LLM calls with the
+        vectorstore round-trip instead of paying their sum.
+
         Returns:
-            Compiled StateGraph
+            Uncompiled StateGraph; BaseAgent compiles it with the checkpointer
         """
         workflow = StateGraph(RAGAgentState)
-        
-        workflow.add_node("think", self._think_node)
-        workflow.add_node("plan", self._plan_node)
-        workflow.add_node("retrieve", self._retrieve_node)
+
+        workflow.add_node("prepare", self._prepare_node)
         workflow.add_node("rerank", self._rerank_node)
         workflow.add_node("generate", self._generate_node)
         workflow.add_node("respond", self._respond_node)
-        
-        workflow.set_entry_point("think")
-        workflow.add_edge("think", "plan")
-        workflow.add_edge("plan", "retrieve")
-        workflow.add_edge("retrieve", "rerank")
+
+        workflow.set_entry_point("prepare")
+        workflow.add_edge("prepare", "rerank")
         workflow.add_edge("rerank", "generate")
         workflow.add_edge("generate", "respond")
         workflow.add_edge("respond", END)
-        
-        return workflow.compile()
+
+        return workflow
+
+    async def _prepare_node(self, state: RAGAgentState) -> Dict[str, Any]:
+        """Run the think → plan chain concurrently with retrieval."""
+
+        async def _reason() -> Dict[str, Any]:
+            think_updates = await self._think_node(state)
+            plan_updates = await self._plan_node({**state, **think_updates})
+            return {**think_updates, **plan_updates}
+
+        reason_updates, retrieve_updates = await asyncio.gather(
+            _reason(),
+            self._retrieve_node(state)
+        )
+
+        return {**reason_updates, **retrieve_updates}
     
     async def _think_node(self, state: RAGAgentState) -> Dict[str, Any]:
         """Think about the retrieval strategy."""
@@ -138,9 +162,16 @@ class RAGAgent(BaseAgent):
             query = state["messages"][-1].content if state.get("messages") else ""
             
             filter_dict = state.get("metadata_filter")
-            
-            documents = await self.vectorstore.similarity_search_with_score(
-                query=query,
+
+            # Embed here rather than inside the store wrapper: the agent
+            # already holds the embedding function, and retrieval runs
+            # concurrently with reasoning, so the embedding round-trip
+            # overlaps the think/plan LLM calls instead of serializing
+            # behind them.
+            query_vec = await self.embeddings.embed_query(query)
+
+            documents = await self.vectorstore.similarity_search_by_vector_with_score(
+                embedding=query_vec,
                 k=self.top_k,
                 filter_dict=filter_dict
             )
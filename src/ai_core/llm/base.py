@@ -144,6 +144,95 @@ class BaseLLMProvider(ABC):
     def invoke(self, messages: List[BaseMessage]) -> Any:
         """Synchronously invoke the LLM (guardrails work only with ainvoke)."""
         return self._invoke_internal(messages)
+
+    async def astream_accumulate(self, messages: List[BaseMessage]) -> Any:
+        """Stream the completion and return the accumulated message.
+
+        Same guarantees as :meth:`ainvoke` — guardrails, retry, fallback
+        model, production degradation, metrics — but the underlying call
+        streams, so chunks surface through the model callbacks and
+        streaming consumers see the first token as soon as it arrives.
+        On a mid-stream failure the attempt is retried from the start;
+        partial chunks from the failed attempt may already have reached
+        callbacks.
+        """
+        for attempt in range(self.max_retries):
+            try:
+                # Guardrail validation
+                input_validation = await self._validate_input(messages)
+                if not input_validation["valid"]:
+                    raise ValueError(f"Input blocked by guardrail: {input_validation['reason']}")
+
+                # Metrics tracking
+                with llm_inference_duration_seconds.labels(
+                    model=self.model,
+                    environment=self._environment.value
+                ).time():
+                    response = None
+                    async for chunk in self.client.astream(messages):
+                        response = chunk if response is None else response + chunk
+                    if response is None:
+                        raise ValueError("LLM stream produced no chunks")
+
+                # Output validation
+                response_text = response.content if hasattr(response, 'content') else str(response)
+                output_validation = await self._validate_output(response_text)
+                if not output_validation["valid"]:
+                    raise ValueError(f"Output blocked by guardrail: {output_validation['reason']}")
+
+                # Track success
+                llm_request_count.labels(
+                    model=self.model,
+                    status="success"
+                ).inc()
+
+                return response
+
+            except Exception as e:
+                base_logger.error(
+                    "llm_stream_failed",
+                    model=self.model,
+                    attempt=attempt + 1,
+                    max_retries=self.max_retries,
+                    error=str(e)
+                )
+
+                # Fallback strategy (production only)
+                if (self._environment == Environment.PRODUCTION
+                    and self.fallback_model
+                    and attempt == self.max_retries - 2):
+                    base_logger.warning(
+                        "switching_to_fallback_model",
+                        from_model=self.model,
+                        to_model=self.fallback_model
+                    )
+                    self.model = self.fallback_model
+                    self._client = None  # Force reinit
+                    continue
+
+                # Last attempt
+                if attempt == self.max_retries - 1:
+                    llm_request_count.labels(
+                        model=self.model,
+                        status="error"
+                    ).inc()
+
+                    # Production degradation
+                    if self._environment == Environment.PRODUCTION:
+                        base_logger.error("llm_all_retries_failed_degrading")
+                        return self._get_fallback_response(e)
+                    raise
+
+        raise RuntimeError(f"Failed after {self.max_retries} attempts")
+
+    async def astream(self, messages: List[BaseMessage]):
+        """Stream response chunks from the LLM.
+
+        Bypasses guardrails/retry — callers that stream (e.g. the intent
+        router) are expected to handle partial output themselves.
+        """
+        async for chunk in self.client.astream(messages):
+            yield chunk
     
     def _get_fallback_response(self, error: Exception) -> AIMessage:
         """Production fallback response when all retries fail."""
@@ -21,7 +21,13 @@ class LLMFactory:
         LLMProviderType.OPENAI: OpenAIProvider,
         LLMProviderType.BEDROCK: BedrockProvider,
     }
-    
+
+    # Shared provider instances keyed by their full configuration. Each
+    # provider owns an HTTP client with its own connection pool, so reusing
+    # one per config keeps keepalive sockets warm instead of rebuilding the
+    # client whenever an agent is constructed.
+    _instances: Dict[tuple, BaseLLMProvider] = {}
+
     @classmethod
     def create(
         cls,
@@ -68,6 +74,46 @@ class LLMFactory:
         
         return provider_class(**init_kwargs)
     
+    @classmethod
+    def create_cached(
+        cls,
+        provider_type: LLMProviderType = LLMProviderType.OPENAI,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> BaseLLMProvider:
+        """
+        Return a shared provider instance for this exact configuration.
+
+        Creates it via create() on first use and reuses it afterwards.
+        Callers that mutate their provider (update_config) should use
+        create() instead to get a private instance.
+
+        Args:
+            provider_type: Type of provider to create
+            model: Model name to use
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Shared LLM provider instance
+        """
+        key = (provider_type, model, temperature, max_tokens, tuple(sorted(kwargs.items())))
+
+        provider = cls._instances.get(key)
+        if provider is None:
+            provider = cls.create(
+                provider_type=provider_type,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+            cls._instances[key] = provider
+        return provider
+
     @classmethod
     def register_provider(
         cls,
@@ -28,7 +28,8 @@ class Neo4jMCPClient(BaseMCPClient):
         try:
             self.neo4j_driver = AsyncGraphDatabase.driver(
                 self.uri,
-                auth=(self.user, self.password)
+                auth=(self.user, self.password),
+                max_connection_pool_size=settings.NEO4J_MAX_POOL_SIZE
             )
             await self.neo4j_driver.verify_connectivity()
             self._connection = {"status": "connected", "uri": self.uri}
@@ -64,18 +65,32 @@ class Neo4jMCPClient(BaseMCPClient):
         else:
             raise ValueError(f"Unknown command: {command}")
     
-    async def execute_cypher(self, query: str) -> List[Dict[str, Any]]:
-        """Execute Cypher query and return results."""
+    async def execute_cypher(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_rows: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute Cypher query and return up to ``max_rows`` results.
+
+        Fetching is bounded at the driver, so an unbounded MATCH stops
+        streaming after the cap instead of materializing every row.
+        """
         if not self.neo4j_driver:
             await self.connect()
-        
+
+        max_rows = max_rows if max_rows is not None else settings.NEO4J_MAX_ROWS
         logger.info(f"Executing Cypher: {query[:100]}...")
-        
+
         async with self.neo4j_driver.session(database=self.database) as session:
-            result = await session.run(query)
-            records = await result.data()
-            logger.info(f"Query returned {len(records)} records")
-            return records
+            result = await session.run(query, params or {})
+            records = await result.fetch(max_rows + 1)
+            if len(records) > max_rows:
+                logger.warning(f"Result truncated at {max_rows} rows")
+                records = records[:max_rows]
+            data = [record.data() for record in records]
+            logger.info(f"Query returned {len(data)} records")
+            return data
     
     async def get_schema(self) -> Dict[str, Any]:
         """Get database schema from Neo4j."""
@@ -133,6 +148,83 @@ class Neo4jMCPClient(BaseMCPClient):
                 "profile_info": str(plan.profile) if hasattr(plan, 'profile') else None
             }
     
+    async def validate_and_execute(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_rows: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Validate via EXPLAIN and execute the query in one session.
+
+        The two calls previously each acquired their own session; running
+        them back to back on one reuses the warm connection and lets
+        Neo4j's plan cache serve the execution straight after the EXPLAIN.
+        If EXPLAIN fails the query is never executed.
+        """
+        if not self.neo4j_driver:
+            await self.connect()
+
+        logger.info(f"Validating and executing Cypher: {query[:100]}...")
+        params = params or {}
+        max_rows = max_rows if max_rows is not None else settings.NEO4J_MAX_ROWS
+
+        async with self.neo4j_driver.session(database=self.database) as session:
+            try:
+                result = await session.run(f"EXPLAIN {query}", params)
+                plan = await result.consume()
+            except Exception as e:
+                logger.warning(f"EXPLAIN failed: {e}")
+                return {
+                    "validation": {
+                        "valid": False,
+                        "errors": [f"EXPLAIN failed: {e}"],
+                        "warnings": []
+                    },
+                    "results": [],
+                    "execution_error": None,
+                    "executed": False,
+                    "truncated": False
+                }
+
+            validation = {
+                "valid": True,
+                "errors": [],
+                "warnings": [],
+                "plan_summary": "Validation passed (based on EXPLAIN plan).",
+                "explain": {
+                    "plan": str(plan.plan) if plan.plan else None,
+                    "profile_info": str(plan.profile) if hasattr(plan, 'profile') else None
+                }
+            }
+
+            try:
+                result = await session.run(query, params)
+                records = await result.fetch(max_rows + 1)
+            except Exception as e:
+                logger.warning(f"Execution failed after EXPLAIN: {e}")
+                return {
+                    "validation": validation,
+                    "results": [],
+                    "execution_error": str(e),
+                    "executed": True,
+                    "truncated": False
+                }
+
+            truncated = len(records) > max_rows
+            if truncated:
+                logger.warning(f"Result truncated at {max_rows} rows")
+                records = records[:max_rows]
+            data = [record.data() for record in records]
+
+            logger.info(f"Query returned {len(data)} records")
+            return {
+                "validation": validation,
+                "results": data,
+                "execution_error": None,
+                "executed": True,
+                "truncated": truncated
+            }
+
     async def validate_query(self, query: str) -> Dict[str, Any]:
         """Validate query using EXPLAIN plan."""
         logger.info(f"Validating query using EXPLAIN: {query[:100]}...")
@@ -140,11 +232,15 @@ class Neo4jMCPClient(BaseMCPClient):
         try:
             explain_result = await self.explain_query(query)
             if explain_result and explain_result.get("plan"):
+                # Pass the plan through: validation and explain share this
+                # one EXPLAIN round-trip, so callers that want the plan
+                # don't need to issue a second one.
                 return {
                     "valid": True,
                     "errors": [],
                     "warnings": [],
-                    "plan_summary": "Validation passed (based on EXPLAIN plan)."
+                    "plan_summary": "Validation passed (based on EXPLAIN plan).",
+                    "explain": explain_result
                 }
             else:
                 return {
@@ -161,6 +257,20 @@ class Neo4jMCPClient(BaseMCPClient):
             }
 
 
+# Shared clients keyed by resolved connection target. The async driver
+# pools Bolt connections internally, so one client per target serves
+# every agent instance instead of opening a fresh driver per request.
+_client_registry: Dict[tuple, Neo4jMCPClient] = {}
+
+
 def get_neo4j_client(config: Optional[Dict[str, Any]] = None) -> Neo4jMCPClient:
-    """Return a Neo4j MCP client instance."""
-    return Neo4jMCPClient(config)
\ No newline at end of file
+    """Return the shared Neo4j MCP client for this connection config."""
+    client = Neo4jMCPClient(config)
+    key = (client.uri, client.user, client.database)
+
+    existing = _client_registry.get(key)
+    if existing is not None:
+        return existing
+
+    _client_registry[key] = client
+    return client
\ No newline at end of file
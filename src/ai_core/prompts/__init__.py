@@ -1,6 +1,10 @@
 """Prompt templates for AI agents and tools."""
 
-from .intent_detection_prompts import get_intent_detection_prompt, AGENT_CAPABILITIES
+from .intent_detection_prompts import (
+    get_intent_detection_prompt,
+    AGENT_CAPABILITIES,
+    INTENT_DETECTION_SYSTEM_PROMPT,
+)
 from .tool_prompts import get_think_prompt, get_plan_prompt
 from .rag_prompts import (
     get_rag_generation_prompt,
@@ -11,11 +15,15 @@ from .rag_prompts import (
 from .neo4j_prompts import (
     get_neo4j_analysis_prompt,
     get_neo4j_generation_prompt,
+    get_neo4j_generation_system_prompt,
+    get_neo4j_generation_user_prompt,
+    get_neo4j_reason_generate_prompt,
 )
 
 __all__ = [
     "get_intent_detection_prompt",
     "AGENT_CAPABILITIES",
+    "INTENT_DETECTION_SYSTEM_PROMPT",
     "get_think_prompt",
     "get_plan_prompt",
     "get_rag_generation_prompt",
@@ -24,4 +32,7 @@ __all__ = [
     "RAG_SYSTEM_PROMPT",
     "get_neo4j_analysis_prompt",
     "get_neo4j_generation_prompt",
+    "get_neo4j_generation_system_prompt",
+    "get_neo4j_generation_user_prompt",
+    "get_neo4j_reason_generate_prompt",
 ]
@@ -36,48 +36,34 @@ AGENT_CAPABILITIES = {
 }
 
 
-def get_intent_detection_prompt(user_input: str) -> str:
-    """Generate intent detection prompt for routing to appropriate agent.
-    
-    Args:
-        user_input: User's input text
-        
-    Returns:
-        Formatted prompt for LLM
-    """
-    agent_details = []
-    for agent_name, info in AGENT_CAPABILITIES.items():
-        keywords_str = ", ".join([f'"{kw}"' for kw in info["keywords"]])
-        examples_str = "\n    ".join([f'- "{ex}"' for ex in info["examples"]])
-        
-        agent_details.append(
-            f"**{agent_name.upper()}**\n"
-            f"  Description: {info['description']}\n"
-            f"  Use When: {info['use_when']}\n"
-            f"  Keywords: {keywords_str}\n"
-            f"  Examples:\n    {examples_str}"
-        )
-    
-    agents_text = "\n\n".join(agent_details)
-    
-    return f"""You are an intent classifier that routes user requests to the appropriate specialized agent.
+# Compact classifier instruction. LLM prefill cost scales with prompt
+# length, so this stays an order of magnitude shorter than the capability
+# table above. Sent as the (byte-stable) system message so providers can
+# serve it from their prompt cache; only the user input varies per call.
+INTENT_DETECTION_SYSTEM_PROMPT = (
+    "Classify the user's message into exactly one agent:\n"
+    "- neo4j: graph database queries (nodes, relationships, paths, Cypher)\n"
+    "- rag: questions answered from stored documents or the knowledge base\n"
+    "- chat: everything else (greetings, general questions, calculations)\n"
+    "Reply with only '<agent> <confidence>', e.g. 'neo4j 0.95'."
+)
 
-Available Agents:
 
-{agents_text}
+# Pre-built template with a single hole; filling it is one C-level format
+# call with no per-request template re-parse.
+_INTENT_USER_TMPL = 'User Input: "%s"'
 
-User Input: "{user_input}"
 
-Instructions:
-1. Analyze the user's intent and keywords carefully
-2. Match to the most appropriate agent based on capabilities and use case
-3. Assign confidence score (0.0-1.0) based on keyword match and context clarity
-4. Respond in the exact format specified below
+def get_intent_detection_prompt(user_input: str) -> str:
+    """Build the per-call human message for intent detection.
 
-Required Output Format:
-<agent> <confidence>
+    The stable instructions live in INTENT_DETECTION_SYSTEM_PROMPT; only the
+    volatile user input goes here so the system prefix stays cacheable.
 
-Example:
-neo4j 0.95
+    Args:
+        user_input: User's input text
 
-Note: Output ONLY the agent name and confidence score, nothing else."""
+    Returns:
+        Formatted prompt for LLM
+    """
+    return _INTENT_USER_TMPL % user_input
@@ -1,5 +1,24 @@
 """Prompts for Neo4j agent."""
 
+# Joined-schema memo. The agent serves one TTL-cached schema dict for
+# minutes at a time, so joining its label/relationship lists recomputed
+# identical strings request after request; keyed by object identity, a
+# single entry covers the steady state.
+_schema_strs_memo: tuple = (None, "", "")
+
+
+def _schema_strs(schema: dict) -> tuple:
+    """Return (node labels, relationship types) as comma-joined strings."""
+    global _schema_strs_memo
+    memo = _schema_strs_memo
+    if memo[0] is schema:
+        return memo[1], memo[2]
+
+    labels = ', '.join(schema.get('node_labels', []))
+    relationships = ', '.join(schema.get('relationship_types', []))
+    _schema_strs_memo = (schema, labels, relationships)
+    return labels, relationships
+
 
 def get_neo4j_analysis_prompt(query: str, schema: dict) -> str:
     """Generate Neo4j analysis prompt (combines thinking + planning).
@@ -11,9 +30,8 @@ def get_neo4j_analysis_prompt(query: str, schema: dict) -> str:
     Returns:
         Formatted analysis prompt
     """
-    node_labels = ', '.join(schema.get('node_labels', []))
-    relationships = ', '.join(schema.get('relationship_types', []))
-    
+    node_labels, relationships = _schema_strs(schema)
+
     return f"""User Query: {query}
 
 Database Schema:
@@ -44,27 +62,62 @@ Analyze this query comprehensively to prepare for Cypher generation.
 Format: Provide a clear analysis covering all three sections above."""
 
 
-def get_neo4j_generation_prompt(query: str, analysis: dict, schema: dict) -> str:
-    """Generate Neo4j Cypher generation prompt.
-    
+def get_neo4j_reason_generate_prompt(query: str, schema: dict) -> str:
+    """Generate the fused analysis + Cypher generation prompt.
+
+    One LLM round-trip produces both the reasoning and the query, instead
+    of paying separate analyze and generate calls (each re-sending the
+    schema) on the happy path.
+
     Args:
         query: User's query
-        analysis: Analysis output from previous step
-        schema: Database schema
-        
+        schema: Database schema information
+
     Returns:
-        Formatted generation prompt
+        Formatted fused prompt
     """
-    analysis_text = analysis.get('analysis', '') if isinstance(analysis, dict) else str(analysis)
-    node_labels = schema.get('node_labels', [])
-    relationships = schema.get('relationship_types', [])
-    
-    return f"""You are a Neo4j Cypher query generator with access to MCP tools.
+    node_labels, relationships = _schema_strs(schema)
+
+    return f"""You are a Neo4j Cypher query generator.
 
 User Query: {query}
 
-Your Analysis:
-{analysis_text}
+Database Schema:
+- Node Labels: {node_labels}
+- Relationship Types: {relationships}
+
+Instructions:
+1. Briefly analyze the query: the user's intent, the relevant labels and
+   relationships, and the MATCH/WHERE/RETURN strategy.
+2. Then generate a syntactically correct, efficient Cypher query based on
+   that analysis, using proper variable naming and returning only the data
+   the user asked for. Use query parameters ($name) for literal values and
+   supply their values in "params", so the database can reuse cached plans.
+
+Required Output Format:
+Return ONLY a JSON object, without markdown or commentary:
+{{"analysis": "<your brief analysis>", "cypher_query": "<the Cypher query>", "params": {{"<param>": <value>}}}}
+
+Your JSON:"""
+
+
+def get_neo4j_generation_system_prompt(schema: dict) -> str:
+    """Generate the static system half of the Cypher generation prompt.
+
+    Contains only the schema and instructions, which stay byte-identical
+    for the lifetime of the cached schema - so provider-side prompt
+    caching keeps working across retries and across requests. Everything
+    per-request or per-attempt belongs in the user prompt.
+
+    Args:
+        schema: Database schema
+
+    Returns:
+        Formatted system prompt
+    """
+    node_labels, relationships = _schema_strs(schema)
+
+    return f"""You are a Neo4j Cypher query generator with access to MCP tools.
 
 Available Schema:
 - Node Labels: {node_labels}
@@ -74,14 +127,56 @@ Instructions:
 1. Generate a syntactically correct Cypher query based on your analysis
 2. Use proper variable naming (lowercase, descriptive)
 3. Include appropriate WHERE clauses for filtering
-4. Return only the data requested by the user
-5. Ensure the query is efficient and follows Neo4j best practices
-6. You can use MCP tools if needed for schema exploration or validation
+4. Use query parameters ($name) for literal values and supply their values
+   in "params", so the database can reuse cached plans
+5. Return only the data requested by the user
+6. Ensure the query is efficient and follows Neo4j best practices
 
 Required Output Format:
-Return ONLY the Cypher query without any explanation, comments, or markdown.
+Return ONLY a JSON object, without markdown or commentary:
+{{"cypher": "<the Cypher query>", "params": {{"<param>": <value>}}}}
 
 Example:
-MATCH (u:User)-[:KNOWS]->(f:User) WHERE u.name = 'Alice' RETURN f.name
+{{"cypher": "MATCH (u:User)-[:KNOWS]->(f:User) WHERE u.name = $name RETURN f.name", "params": {{"name": "Alice"}}}}"""
+
+
+def get_neo4j_generation_user_prompt(query: str, analysis: dict) -> str:
+    """Generate the dynamic user half of the Cypher generation prompt.
 
-Your Cypher Query:"""
+    Args:
+        query: User's query
+        analysis: Analysis output from previous step
+
+    Returns:
+        Formatted user prompt
+    """
+    analysis_text = analysis.get('analysis', '') if isinstance(analysis, dict) else str(analysis)
+
+    return f"""User Query: {query}
+
+Your Analysis:
+{analysis_text}
+
+Your JSON:"""
+
+
+def get_neo4j_generation_prompt(query: str, analysis: dict, schema: dict) -> str:
+    """Generate the full Neo4j Cypher generation prompt as one string.
+
+    Kept for callers that don't split system/user roles; the generate
+    node uses the system/user pair above to preserve the cacheable
+    prefix across retries.
+
+    Args:
+        query: User's query
+        analysis: Analysis output from previous step
+        schema: Database schema
+
+    Returns:
+        Formatted generation prompt
+    """
+    return (
+        get_neo4j_generation_system_prompt(schema)
+        + "\n\n"
+        + get_neo4j_generation_user_prompt(query, analysis)
+    )
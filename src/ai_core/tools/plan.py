@@ -52,9 +52,12 @@ class PlanTool(BaseTool):
                 "error": "Missing prompt parameter"
             }
         
-        llm = LLMFactory.create(
+        # Reasoning tier: plans only condition later prompts, so the
+        # cheaper model is enough. Cached so repeated tool calls share
+        # one provider instead of rebuilding the HTTP client.
+        llm = LLMFactory.create_cached(
             provider_type=LLMProviderType(settings.LLM_PROVIDER),
-            model=settings.LLM_MODEL,
+            model=settings.REASONING_LLM_MODEL,
             temperature=0.2,
             max_tokens=settings.LLM_MAX_TOKENS,
             api_key=settings.OPENAI_API_KEY,
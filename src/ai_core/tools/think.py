@@ -31,9 +31,12 @@ class ThinkTool(BaseTool):
                 "error": "Missing prompt parameter"
             }
         
-        llm = LLMFactory.create(
+        # Reasoning tier: thinking output only conditions later prompts,
+        # so the cheaper model is enough. Cached so repeated tool calls
+        # share one provider instead of rebuilding the HTTP client.
+        llm = LLMFactory.create_cached(
             provider_type=LLMProviderType(settings.LLM_PROVIDER),
-            model=settings.LLM_MODEL,
+            model=settings.REASONING_LLM_MODEL,
             temperature=0.3,
             max_tokens=settings.LLM_MAX_TOKENS,
             api_key=settings.OPENAI_API_KEY,
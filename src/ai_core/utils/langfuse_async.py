@@ -0,0 +1,79 @@
+"""Async adapter around the sync Langfuse callback handler.
+
+The Langfuse LangChain ``CallbackHandler`` does its network I/O on the
+calling thread. Passed directly into ``graph.ainvoke`` that means trace
+emission runs on the event-loop thread and stalls every other request at
+chain-end time. This adapter forwards each callback to the sync handler on
+a small dedicated thread pool so the event loop never waits on Langfuse.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+
+from langchain_core.callbacks import AsyncCallbackHandler
+
+# Two workers are plenty: callbacks are tiny enqueue operations, the actual
+# flush happens on Langfuse's own background thread.
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="langfuse")
+
+
+class AsyncLangfuseHandler(AsyncCallbackHandler):
+    """Forwards callbacks to a sync Langfuse handler off the event loop."""
+
+    def __init__(self, sync_handler):
+        self._sync_handler = sync_handler
+
+    async def _offload(self, method_name: str, *args, **kwargs) -> None:
+        method = getattr(self._sync_handler, method_name, None)
+        if method is None:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                _executor, partial(method, *args, **kwargs)
+            )
+        except Exception:
+            # Tracing must never fail the traced request.
+            pass
+
+    async def on_chat_model_start(self, *args, **kwargs) -> None:
+        await self._offload("on_chat_model_start", *args, **kwargs)
+
+    async def on_llm_start(self, *args, **kwargs) -> None:
+        await self._offload("on_llm_start", *args, **kwargs)
+
+    async def on_llm_new_token(self, *args, **kwargs) -> None:
+        await self._offload("on_llm_new_token", *args, **kwargs)
+
+    async def on_llm_end(self, *args, **kwargs) -> None:
+        await self._offload("on_llm_end", *args, **kwargs)
+
+    async def on_llm_error(self, *args, **kwargs) -> None:
+        await self._offload("on_llm_error", *args, **kwargs)
+
+    async def on_chain_start(self, *args, **kwargs) -> None:
+        await self._offload("on_chain_start", *args, **kwargs)
+
+    async def on_chain_end(self, *args, **kwargs) -> None:
+        await self._offload("on_chain_end", *args, **kwargs)
+
+    async def on_chain_error(self, *args, **kwargs) -> None:
+        await self._offload("on_chain_error", *args, **kwargs)
+
+    async def on_tool_start(self, *args, **kwargs) -> None:
+        await self._offload("on_tool_start", *args, **kwargs)
+
+    async def on_tool_end(self, *args, **kwargs) -> None:
+        await self._offload("on_tool_end", *args, **kwargs)
+
+    async def on_tool_error(self, *args, **kwargs) -> None:
+        await self._offload("on_tool_error", *args, **kwargs)
+
+    async def on_retriever_start(self, *args, **kwargs) -> None:
+        await self._offload("on_retriever_start", *args, **kwargs)
+
+    async def on_retriever_end(self, *args, **kwargs) -> None:
+        await self._offload("on_retriever_end", *args, **kwargs)
+
+    async def on_retriever_error(self, *args, **kwargs) -> None:
+        await self._offload("on_retriever_error", *args, **kwargs)
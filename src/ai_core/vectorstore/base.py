@@ -92,6 +92,31 @@ class BaseVectorStore(ABC):
         """
         pass
     
+    @abstractmethod
+    async def similarity_search_by_vector_with_score(
+        self,
+        embedding: List[float],
+        k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> List[tuple[Document, float]]:
+        """
+        Search with a precomputed query embedding.
+
+        Lets callers that already hold the query vector (or batch-embed
+        several queries) skip the embedding step inside the store.
+
+        Args:
+            embedding: Query embedding vector
+            k: Number of results to return
+            filter_dict: Metadata filters
+            **kwargs: Additional arguments
+
+        Returns:
+            List of (document, score) tuples
+        """
+        pass
+
     @abstractmethod
     async def delete_by_ids(self, ids: List[str]) -> bool:
         """
@@ -113,19 +113,45 @@ class PgVectorStore(BaseVectorStore):
         """
         logger.info(f"Searching for similar documents (MOCK): '{query[:50]}...'")
         await asyncio.sleep(0.15)
-        
+
         query_embedding = self._generate_mock_embedding(seed=hash(query))
-        
+
+        return await self.similarity_search_by_vector_with_score(
+            embedding=query_embedding,
+            k=k,
+            filter_dict=filter_dict,
+            **kwargs
+        )
+
+    async def similarity_search_by_vector_with_score(
+        self,
+        embedding: List[float],
+        k: int = 5,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> List[tuple[Document, float]]:
+        """
+        Search with a precomputed query embedding (mocked).
+
+        Args:
+            embedding: Query embedding vector
+            k: Number of results to return
+            filter_dict: Metadata filters
+            **kwargs: Additional arguments
+
+        Returns:
+            List of (document, score) tuples
+        """
         filtered_docs = self._apply_filters(filter_dict)
-        
+
         results = []
         for doc in filtered_docs:
-            similarity = self._cosine_similarity(query_embedding, doc.embedding)
+            similarity = self._cosine_similarity(embedding, doc.embedding)
             results.append((doc, similarity))
-        
+
         results.sort(key=lambda x: x[1], reverse=True)
         results = results[:k]
-        
+
         logger.info(f"Found {len(results)} similar documents (MOCK)")
         return results
     
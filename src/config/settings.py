@@ -1,7 +1,7 @@
 from pydantic_settings import BaseSettings
 from enum import Enum
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 
 class Environment(str, Enum):
@@ -23,6 +23,25 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
+    # Open and handshake min_size checkpointer connections at pool creation
+    # so the first agent invocation doesn't pay TCP+TLS+auth latency.
+    # Disable in tests to avoid touching a real database.
+    DB_POOL_PREWARM: bool = True
+    # Checkpointer pool sizing. Unset means "derive from the environment":
+    # max from the per-environment map, min as a quarter of max (>= 2).
+    # Ops can pin both for burst-heavy deployments.
+    DB_POOL_MIN_SIZE: Optional[int] = None
+    DB_POOL_MAX_SIZE: Optional[int] = None
+    # Seconds a request waits for a free checkpointer connection before
+    # failing, and how many requests may queue for one (0 = unlimited).
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_MAX_WAITING: int = 0
+    # psycopg prepared-statement threshold for checkpointer connections.
+    # Checkpoint writes and session clears repeat the same statements, so
+    # server-side plans skip parse+plan after this many executions. Set to
+    # None (null) when running behind transaction-mode pgbouncer, which
+    # can't track prepared statements.
+    PSYCOPG_PREPARE_THRESHOLD: Optional[int] = 5
     
     OPENAI_API_BASE: str = "https://openrouter.ai/api/v1"
     OPENAI_API_KEY: str
@@ -31,9 +50,17 @@ class Settings(BaseSettings):
     LLM_TEMPERATURE: float = 0.7
     LLM_MAX_TOKENS: int = 2000
     LLM_FALLBACK_MODEL: str = "openai/gpt-3.5-turbo"
+    # Cheaper tier for free-form reasoning (think/plan/evaluate calls),
+    # whose output only conditions later prompts and never reaches users.
+    REASONING_LLM_MODEL: str = "openai/gpt-4o-mini-2024-07-18"
     
     # Checkpointer Configuration
     ENABLE_CHECKPOINTER: bool = True
+    # Let the checkpointer supply prior chat turns: execute() sends only
+    # the system prompt and the new user message and the add_messages
+    # reducer merges the persisted thread. Disable to replay the caller's
+    # history on every turn (pre-checkpointer behavior).
+    CHAT_CHECKPOINT_HISTORY: bool = True
     CHECKPOINT_TABLES: List[str] = ["checkpoints", "checkpoint_writes", "checkpoint_blobs"]
     CHECKPOINT_RETENTION_DAYS: int = 30
     
@@ -58,6 +85,9 @@ class Settings(BaseSettings):
             Environment.PRODUCTION: 20,
         }.get(self.ENVIRONMENT, 10)
     
+    # Speculatively warm the most-likely agent while intent detection runs
+    ROUTER_SPECULATIVE: bool = False
+
     API_PREFIX: str = "/api/v1"
     ALLOWED_ORIGINS: str = "*"
     
@@ -77,11 +107,40 @@ class Settings(BaseSettings):
     NEO4J_USER: str = "neo4j"
     NEO4J_PASSWORD: str = "neo4j"
     NEO4J_DATABASE: str = "neo4j"
+    # Bolt connection pool cap for the shared Neo4j driver.
+    NEO4J_MAX_POOL_SIZE: int = 50
     
     # Neo4j Agent Configuration
     NEO4J_AGENT_MAX_RETRIES: int = 3
+    # Seconds to reuse a fetched Neo4j schema before hitting the database
+    # again; schemas change on the order of hours, not per query.
+    NEO4J_SCHEMA_TTL: float = 300.0
+    # Per-attempt deadline for Cypher execution; a hung query becomes a
+    # retryable error instead of stalling the whole request.
+    NEO4J_QUERY_TIMEOUT: float = 30.0
+    # Rows fetched per Cypher execution; an unbounded MATCH stops at this
+    # cap instead of materializing the whole result set.
+    NEO4J_MAX_ROWS: int = 1000
+
+    # Coalesce concurrent chat LLM calls into one provider batch request.
+    # Opt-in: batched calls go through the client directly and skip the
+    # provider's per-call retry/fallback wrapper.
+    CHAT_BATCH_ENABLED: bool = False
+    CHAT_BATCH_MAX: int = 8
+    CHAT_BATCH_WINDOW_MS: int = 10
+
+    # Hard deadline for a single agent graph execution, in seconds. Bounds
+    # tail latency: a stalled LLM call or callback fails fast and frees the
+    # worker instead of pinning it indefinitely.
+    AGENT_TIMEOUT_S: float = 120.0
     
     LANGFUSE_ENABLED: bool = False
+    # Escape hatch: pass the sync Langfuse handler straight into the graph
+    # instead of the async thread-pool adapter.
+    LANGFUSE_BLOCKING: bool = False
+    # Fraction of agent executions that carry the tracing callback
+    # (1.0 = trace everything; lower in production to cap tracing cost).
+    LANGFUSE_SAMPLE_RATE: float = 1.0
     LANGFUSE_PUBLIC_KEY: str = ""
     LANGFUSE_SECRET_KEY: str = ""
     LANGFUSE_HOST: str = "https://cloud.langfuse.com"
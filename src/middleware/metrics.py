@@ -68,6 +68,13 @@ agent_response_time_seconds = Histogram(
     ['agent_type']
 )
 
+agent_first_token_seconds = Histogram(
+    'agent_first_token_seconds',
+    'Time until the first streamed token is yielded',
+    ['agent_type'],
+    buckets=[0.1, 0.3, 0.5, 1.0, 2.0, 5.0]
+)
+
 
 class MetricsMiddleware:
     """Middleware for tracking HTTP request metrics."""